@@ -39,23 +39,48 @@ Usage:
   python gdd_weed_alert.py --status     # Show current GDD accumulation and upcoming triggers
   python gdd_weed_alert.py --test       # Send test alerts for all trigger types
   python gdd_weed_alert.py --backfill   # Backfill GDD data from Jan 1 of current year
+
+  Set GDD_DEBUG=1 to also write DEBUG lines to gdd_weed_alert.log (rotated at 1 MB).
 """
 
 import sys
 import os
 import json
+import atexit
+import functools
+import hashlib
+import importlib.util
 import sqlite3
 import logging
+import threading
+import time
+import urllib.parse
+import zlib
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from itertools import accumulate, groupby, islice, zip_longest
+from logging.handlers import RotatingFileHandler
 
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'python_libs'))
 
+# requests is only imported on first HTTP use (see GDDWeedAlert.session), so
+# runs that stay offline skip loading it and urllib3. Without it installed,
+# the standard library is used instead; see _UrllibSession below.
+REQUESTS_AVAILABLE = importlib.util.find_spec("requests") is not None
+if not REQUESTS_AVAILABLE:
+    import gzip
+    import urllib.request
+
+# requests.RequestException and urllib's URLError are both OSError
+# subclasses; ValueError is an undecodable body, see json_loads below.
+HTTP_ERRORS = (OSError, ValueError)
+
+# orjson is optional; it decodes Open-Meteo payloads several times faster
 try:
-    import requests
-    REQUESTS_AVAILABLE = True
+    from orjson import loads as json_loads
 except ImportError:
-    REQUESTS_AVAILABLE = False
-    print("WARNING: 'requests' library not found. Install with: pip install requests")
+    json_loads = json.loads
 
 
 # =============================================================================
@@ -74,6 +99,34 @@ ZAPIER_CONFIG = {
     "phone_number": os.environ.get("ALERT_PHONE_NUMBER", ""),
 }
 
+# Open-Meteo endpoints. The forecast call also returns the last `past_days`
+# days; backfill's archive range still runs up to `archive_lag_days` ago so
+# the two overlap, and archive values fill any day the forecast has nulls for.
+OPEN_METEO = {
+    "archive_url": "https://archive-api.open-meteo.com/v1/archive",
+    "forecast_url": "https://api.open-meteo.com/v1/forecast",
+    "past_days": 14,
+    "archive_lag_days": 5,   # Archive data trails real time by a few days
+    "forecast_days": 16,
+    "timeout": (3.05, 30),   # (connect, read) seconds
+    # weather_cache freshness. Archive days are final, so those responses
+    # never go stale; forecasts are reused for a short while only.
+    "forecast_cache_seconds": 15 * 60,
+    "cache_keep_days": 30,
+    "cache_compress_level": 6,   # zlib level for stored response bodies
+}
+
+# Query parameters shared by both endpoints, encoded once at import. The
+# fetch methods only append their date range or day counts.
+OPEN_METEO_QUERY = urllib.parse.urlencode({
+    "latitude": LOCATION["latitude"],
+    "longitude": LOCATION["longitude"],
+    "daily": "temperature_2m_max,temperature_2m_min,precipitation_sum",
+    "temperature_unit": "fahrenheit",
+    "precipitation_unit": "inch",
+    "timezone": LOCATION["timezone"],
+})
+
 # GDD Base Temperatures
 GDD_BASES = {
     "GDD50": 50.0,   # Warm-season annuals (crabgrass, foxtail)
@@ -171,45 +224,257 @@ TRIGGERS = {
     },
 }
 
+# Days of daily_weather the trigger checks look back over; loaded once per
+# run and shared by all of them (covers the longest avg_temp_window too)
+RECENT_WINDOW_DAYS = 14
+
+# Season membership, frozen once at import for O(1) month lookups
+TRIGGER_SEASONS = {
+    key: frozenset(trigger["season_months"]) for key, trigger in TRIGGERS.items()
+}
+
+# SMS text for each alert, as (SPROUTING, SPRAY BY) str.format templates.
+# A single-entry tuple is a standalone alert. Filled in only when a check
+# fires; early/late are short dates from _short_date().
+ALERT_MESSAGES = {
+    "fall_pre": (
+        "SPROUTING: Fall Weeds\n"
+        "5d Avg {avg_temp:.0f}F | Rain {rain:.2f}in\n"
+        "Weeds: chickweed, henbit, mustards, Poa annua",
+        "SPRAY BY: Fall PRE-Emergent\n"
+        "Spray {early}-{late}\n"
+        "Apply PRE on clean soil before germination",
+    ),
+    "late_winter_post": (
+        "SPROUTING: Winter Weeds\n"
+        "{days}d >{threshold:.0f}F | GDD32: {gdd:.0f}\n"
+        "Weeds: chickweed, henbit, shepherd purse",
+        "SPRAY BY: Winter Weeds\n"
+        "Spray {early}-{late}\n"
+        "Spot-spray POST while weeds <6in",
+    ),
+    "spring_pre": (
+        "SPROUTING: Crabgrass/Foxtail\n"
+        "GDD50: {gdd:.0f} (sprout at {germination})\n"
+        "PRE window passed, use POST",
+        "SPRAY BY: Crabgrass/Foxtail\n"
+        "Spray {early}-{late}\n"
+        "POST on small seedlings (2-6 leaf)",
+    ),
+    "spring_pre_applyby": (
+        "SPROUTING SOON: Crabgrass/Foxtail\n"
+        "GDD50: {gdd:.0f} | Sprout at {germination}\n"
+        "Not sprouted yet",
+        "APPLY PRE NOW!\n"
+        "Weeds: crabgrass, foxtail\n"
+        "Apply PRE before GDD50 hits {germination}",
+    ),
+    "spring_pre_headsup": (
+        "HEADS UP: PRE-Emergent Soon\n"
+        "GDD50: {gdd:.0f} | Apply by {apply_by}\n"
+        "Weeds: crabgrass, foxtail\n"
+        "Plan application now",
+    ),
+    "spring_broadleaf": (
+        "SPROUTING: Broadleaf Weeds\n"
+        "GDD50: {gdd:.0f} (threshold {emergence})\n"
+        "Weeds: pigweed, ragweed, spurge",
+        "SPRAY BY: Broadleaf Weeds\n"
+        "Spray {early}-{late}\n"
+        "POST while seedlings small (2-6 leaf)",
+    ),
+    "perennial_fall": (
+        "SPROUTING: Fall Perennials\n"
+        "7d Avg {avg_temp:.0f}F - rosettes forming\n"
+        "Weeds: dandelion, dock, thistle, plantain",
+        "SPRAY BY: Fall Perennials\n"
+        "Spray {early}-{late}\n"
+        "Treat rosettes before dormancy",
+    ),
+    "perennial_spring": (
+        "SPROUTING: Spring Perennials\n"
+        "{days}d >{threshold:.0f}F | GDD50: {gdd:.0f}\n"
+        "Weeds: dandelion, dock, thistle, plantain",
+        "SPRAY BY: Spring Perennials\n"
+        "Spray {early}-{late}\n"
+        "Treat rosettes before bolting",
+    ),
+    # Phase 2 follow-up from spray_schedule (see check_spray_windows)
+    "spray_now": (
+        "SPRAY NOW: {name}\n"
+        "{urgency} {days}d since sprout\n"
+        "Weeds: {weeds}\n"
+        "Spray by: {spray_by}",
+    ),
+}
+
+# --test sample readings: one ALERT_MESSAGES pair per trigger type,
+# formatted through the same templates the checks use
+TEST_ALERTS = (
+    ("fall_pre", {"avg_temp": 65, "rain": 0.48}),
+    ("perennial_fall", {"avg_temp": 62}),
+    ("spring_pre", {"gdd": 205, "germination": 200}),
+    ("spring_broadleaf", {"gdd": 320, "emergence": 300}),
+    ("perennial_spring", {"days": 7, "threshold": 50, "gdd": 120}),
+)
+
+# Month -> in-season TRIGGERS keys (in TRIGGERS order), so the daily run
+# iterates only the checks that can fire
+TRIGGERS_BY_MONTH = {
+    month: tuple(key for key, months in TRIGGER_SEASONS.items() if month in months)
+    for month in range(1, 13)
+}
+
+# =============================================================================
+# GDD MATH
+# =============================================================================
+
+def compute_gdd_columns(tmin, tmax,
+                        base50=GDD_BASES["GDD50"], base32=GDD_BASES["GDD32"]):
+    """
+    Return (gdd50, gdd32) for one day's min/max temperature. The mean
+    itself is not returned: daily_weather derives tmean_f as a generated
+    column. The bases are bound once at definition time rather than looked
+    up per day.
+    """
+    tmean = (tmax + tmin) / 2.0
+    return max(0.0, tmean - base50), max(0.0, tmean - base32)
+
+
+def longest_warm_streak(rows, threshold):
+    """
+    Return the longest run of consecutive daily_weather rows whose mean
+    temp is at least threshold. groupby splits the rows into warm and cool
+    islands, so only the length of each warm island is counted.
+    """
+    islands = groupby(rows, key=lambda row: row[3] is not None and row[3] >= threshold)
+    return max((sum(1 for _ in run) for warm, run in islands if warm), default=0)
+
+
 # =============================================================================
 # DATABASE
 # =============================================================================
 
 DB_NAME = "gdd_sis.db"
 
+# Stored in PRAGMA user_version once init_database has brought a database up
+# to date. Bump it whenever the schema below changes.
+SCHEMA_VERSION = 2
+
+_CONN = None  # Process-wide connection, see get_connection()
+_DB_LOCK = threading.Lock()  # Serializes cache access from fetch threads
 
+# UPDATE ... FROM (used for the window-function updates) needs SQLite 3.33+
+SQLITE_HAS_UPDATE_FROM = sqlite3.sqlite_version_info >= (3, 33, 0)
+
+
+@functools.lru_cache(maxsize=None)
 def get_db_path(script_dir):
     return os.path.join(script_dir, DB_NAME)
 
 
-def init_database(db_path):
-    """Create the GDD-SIS database tables if they don't exist."""
-    conn = sqlite3.connect(db_path)
-    c = conn.cursor()
+# tmean_f is derived from tmin/tmax, so it is computed on read rather than
+# stored. It keeps its column position in the table all the same.
+# WITHOUT ROWID: rows live in the date primary-key B-tree itself, so date
+# lookups and range scans need no second index-to-rowid hop.
+DAILY_WEATHER_SCHEMA = """
+    CREATE TABLE {if_not_exists}daily_weather (
+        date TEXT PRIMARY KEY,
+        tmin_f REAL,
+        tmax_f REAL,
+        tmean_f REAL GENERATED ALWAYS AS ((tmin_f + tmax_f) / 2.0) VIRTUAL,
+        precip_in REAL,
+        gdd50 REAL,
+        gdd32 REAL,
+        cum_gdd50 REAL,
+        cum_gdd32 REAL,
+        avg_temp_5day REAL,
+        rain_2day_sum REAL
+    ) WITHOUT ROWID
+"""
 
-    c.execute("""
-        CREATE TABLE IF NOT EXISTS daily_weather (
-            date TEXT PRIMARY KEY,
-            tmin_f REAL,
-            tmax_f REAL,
-            tmean_f REAL,
-            precip_in REAL,
-            gdd50 REAL,
-            gdd32 REAL,
-            cum_gdd50 REAL,
-            cum_gdd32 REAL,
-            avg_temp_5day REAL,
-            rain_2day_sum REAL
-        )
+# Columns actually stored in daily_weather (everything but generated ones)
+DAILY_WEATHER_STORED_COLUMNS = (
+    "date, tmin_f, tmax_f, precip_in, gdd50, gdd32, "
+    "cum_gdd50, cum_gdd32, avg_temp_5day, rain_2day_sum"
+)
+
+# Row layout returned by the _get_*_data readers; checks index rows by
+# position (row[3] = tmean_f, row[7] = cum_gdd50, ...), so list the columns
+# explicitly rather than relying on SELECT * and the table's column order
+DAILY_WEATHER_ROW_COLUMNS = (
+    "date, tmin_f, tmax_f, tmean_f, precip_in, gdd50, gdd32, "
+    "cum_gdd50, cum_gdd32, avg_temp_5day, rain_2day_sum"
+)
+
+
+def _rebuild_daily_weather(c):
+    """
+    Recreate daily_weather with the current schema, keeping its rows. The
+    caller must hold a transaction so the rename/copy/drop is atomic.
+    """
+    c.execute("ALTER TABLE daily_weather RENAME TO daily_weather_old")
+    c.execute(DAILY_WEATHER_SCHEMA.format(if_not_exists=""))
+    c.execute(f"""
+        INSERT INTO daily_weather ({DAILY_WEATHER_STORED_COLUMNS})
+        SELECT {DAILY_WEATHER_STORED_COLUMNS} FROM daily_weather_old
     """)
+    c.execute("DROP TABLE daily_weather_old")
 
+
+# sent_at is Unix epoch seconds: compact, integer-compared index entries
+ALERTS_SENT_SCHEMA = """
+    CREATE TABLE {if_not_exists}alerts_sent (
+        alert_key TEXT PRIMARY KEY,
+        sent_at INTEGER,
+        message TEXT
+    )
+"""
+
+
+def _rebuild_alerts_sent(c):
+    """
+    Recreate alerts_sent with epoch sent_at, converting ISO local times.
+    Like _rebuild_daily_weather, only called inside init_database's
+    transaction, so the rename/copy/drop commits or rolls back as a whole.
+    """
+    c.execute("ALTER TABLE alerts_sent RENAME TO alerts_sent_old")
+    c.execute(ALERTS_SENT_SCHEMA.format(if_not_exists=""))
     c.execute("""
-        CREATE TABLE IF NOT EXISTS alerts_sent (
-            alert_key TEXT PRIMARY KEY,
-            sent_at TEXT,
-            message TEXT
-        )
+        INSERT INTO alerts_sent (alert_key, sent_at, message)
+        SELECT alert_key, CAST(strftime('%s', sent_at, 'utc') AS INTEGER), message
+        FROM alerts_sent_old
     """)
+    c.execute("DROP TABLE alerts_sent_old")  # Also drops its sent_at index
+
+
+def _create_schema(c):
+    """
+    Create any missing tables and indexes and rebuild outdated ones. Runs
+    inside init_database's transaction; does not commit.
+    """
+    c.execute(DAILY_WEATHER_SCHEMA.format(if_not_exists="IF NOT EXISTS "))
+
+    # Databases created before tmean_f became a generated column still
+    # store it (hidden == 0 means a regular column), and older ones are
+    # rowid tables with a separate date index. Rebuild those once.
+    hidden_flags = {row[1]: row[6] for row in c.execute("PRAGMA table_xinfo(daily_weather)")}
+    table_sql = c.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'daily_weather'"
+    ).fetchone()[0]
+    if hidden_flags.get("tmean_f") == 0 or "WITHOUT ROWID" not in table_sql.upper():
+        _rebuild_daily_weather(c)
+
+    c.execute(ALERTS_SENT_SCHEMA.format(if_not_exists="IF NOT EXISTS "))
+    # sent_at used to be an ISO-format TEXT timestamp
+    column_types = {row[1]: row[2] for row in c.execute("PRAGMA table_info(alerts_sent)")}
+    if column_types.get("sent_at") == "TEXT":
+        _rebuild_alerts_sent(c)
+
+    # show_status lists alerts newest-first; index the sort key so that is
+    # an index walk rather than a full sort. (daily_weather needs no extra
+    # index: its date PRIMARY KEY already serves ORDER BY date DESC LIMIT N.)
+    c.execute("CREATE INDEX IF NOT EXISTS idx_alerts_sent_at ON alerts_sent(sent_at)")
 
     # Spray schedule: tracks when sprouting was detected so we can
     # send the follow-up "time to spray" alert at the right time
@@ -226,10 +491,115 @@ def init_database(db_path):
         )
     """)
 
+    # Raw Open-Meteo responses (zlib-compressed), keyed by endpoint + query
+    # parameters
+    c.execute("""
+        CREATE TABLE IF NOT EXISTS weather_cache (
+            cache_key TEXT PRIMARY KEY,
+            fetched_at TEXT,
+            json_body BLOB
+        )
+    """)
+
+
+def init_database(db_path):
+    """Create the GDD-SIS database tables if they don't exist."""
+    # Shared with fetch threads (under _DB_LOCK); cache fits every statement
+    conn = sqlite3.connect(db_path, check_same_thread=False, cached_statements=256)
+    c = conn.cursor()
+
+    # 8 KiB pages hold twice the daily_weather rows per B-tree node. This
+    # only takes effect on a brand-new file: it must precede the first
+    # table, and a WAL database keeps its page size for good.
+    c.execute("PRAGMA page_size=8192")
+
+    # WAL + NORMAL sync: one fsync per checkpoint instead of per commit,
+    # which is what dominates backfill writes.
+    c.execute("PRAGMA journal_mode=WAL")
+    c.execute("PRAGMA synchronous=NORMAL")
+    c.execute("PRAGMA temp_store=MEMORY")
+    c.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache (negative = KiB)
+    c.execute("PRAGMA mmap_size=268435456")
+
+    # Schema already current: skip the CREATE/migration pass and its commit
+    if c.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION:
+        return conn
+
+    # Create/migrate in one explicit transaction, user_version included, so
+    # a crash or error part-way through a table rebuild rolls back to the
+    # old schema rather than leaving a half-renamed table behind
+    c.execute("BEGIN")
+    try:
+        _create_schema(c)
+        c.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    except BaseException:
+        conn.rollback()
+        raise
     conn.commit()
     return conn
 
 
+def get_connection(script_dir):
+    """
+    Return the shared database connection, opening and initializing it on
+    first use. Closed at interpreter exit so the WAL is checkpointed.
+    """
+    global _CONN
+    if _CONN is None:
+        _CONN = init_database(get_db_path(script_dir))
+        atexit.register(_CONN.close)
+    return _CONN
+
+
+# =============================================================================
+# HTTP FALLBACK
+# =============================================================================
+
+class _UrllibResponse:
+    """The subset of requests.Response that this script uses."""
+
+    def __init__(self, status_code, content):
+        self.status_code = status_code
+        self.content = content
+
+    def raise_for_status(self):
+        # urlopen already raises HTTPError for 4xx/5xx responses
+        pass
+
+
+class _UrllibSession:
+    """
+    Minimal stand-in for requests.Session when requests is not installed.
+    Only get() and post() as called by GDDWeedAlert are supported.
+    """
+
+    def __init__(self):
+        self.headers = {}
+
+    def _open(self, req, timeout):
+        if isinstance(timeout, tuple):
+            timeout = max(timeout)  # urllib has a single socket timeout
+        with urllib.request.urlopen(req, timeout=timeout) as r:
+            content = r.read()
+            if r.headers.get("Content-Encoding") == "gzip":
+                content = gzip.decompress(content)
+            return _UrllibResponse(r.status, content)
+
+    def get(self, url, params=None, timeout=None):
+        if params:
+            url = url + "?" + urllib.parse.urlencode(params)
+        headers = dict(self.headers)
+        headers["Accept-Encoding"] = "gzip"  # deflate is not decoded here
+        return self._open(urllib.request.Request(url, headers=headers), timeout)
+
+    def post(self, url, data=None, headers=None, timeout=None):
+        all_headers = dict(self.headers)
+        all_headers.update(headers or {})
+        all_headers.pop("Accept-Encoding", None)
+        req = urllib.request.Request(url, data=data, headers=all_headers, method="POST")
+        return self._open(req, timeout)
+
+
 # =============================================================================
 # GDD WEED ALERT AGENT
 # =============================================================================
@@ -244,31 +614,68 @@ class GDDWeedAlert:
         self.script_dir = os.path.dirname(os.path.abspath(__file__))
         self.logger = self._setup_logging()
 
-        if not REQUESTS_AVAILABLE:
-            self.logger.error("Cannot run without 'requests' library.")
-            sys.exit(1)
-
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.db_path = get_db_path(self.script_dir)
+        self.conn = get_connection(self.script_dir)
+
+        self._session = None
+        self._session_lock = threading.Lock()  # Fetch/send pools race on first use
+
+    @property
+    def session(self):
+        """HTTP session, built (and requests imported) on first use."""
+        with self._session_lock:
+            if self._session is None:
+                self._session = self._build_session()
+            return self._session
+
+    @session.setter
+    def session(self, session):
+        with self._session_lock:
+            self._session = session
+
+    def _build_session(self):
+        if REQUESTS_AVAILABLE:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            session = requests.Session()
+            # Keep-alive pool + retries on transient Open-Meteo errors. Retry
+            # only covers idempotent methods, so Zapier POSTs are never re-sent.
+            # One pool per host (archive, forecast, Zapier); pool_maxsize lets
+            # concurrent requests to one host each keep their connection.
+            retry = Retry(total=3, backoff_factor=0.5,
+                          status_forcelist=(429, 500, 502, 503, 504))
+            session.mount("https://", HTTPAdapter(
+                pool_connections=4, pool_maxsize=10, max_retries=retry))
+        else:
+            self.logger.debug("'requests' not installed, using urllib")
+            session = _UrllibSession()
+        session.headers.update({
             "User-Agent": "GDDWeedAlert/1.0",
             "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate",
         })
-
-        self.db_path = get_db_path(self.script_dir)
-        self.conn = init_database(self.db_path)
+        return session
 
     def _setup_logging(self):
         logger = logging.getLogger("GDDWeedAlert")
-        logger.setLevel(logging.DEBUG)
         if logger.handlers:
             return logger
 
+        # DEBUG output is opt-in (GDD_DEBUG=1); otherwise debug() calls are
+        # dropped at the logger before any formatting happens.
+        debug = os.environ.get("GDD_DEBUG") == "1"
+        logger.setLevel(logging.DEBUG if debug else logging.INFO)
+
         formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s",
                                       datefmt="%Y-%m-%d %H:%M:%S")
 
         log_path = os.path.join(self.script_dir, "gdd_weed_alert.log")
-        fh = logging.FileHandler(log_path, encoding="utf-8")
-        fh.setLevel(logging.DEBUG)
+        # delay: the file is only opened once something is logged
+        fh = RotatingFileHandler(log_path, maxBytes=1_000_000, backupCount=3,
+                                 encoding="utf-8", delay=True)
+        fh.setLevel(logging.DEBUG if debug else logging.INFO)
         fh.setFormatter(formatter)
         logger.addHandler(fh)
 
@@ -283,51 +690,69 @@ class GDDWeedAlert:
     # Weather Data Fetching
     # -------------------------------------------------------------------------
 
+    def _get_json(self, url, max_age):
+        """
+        GET a full Open-Meteo URL and return the decoded JSON, serving
+        repeat requests from the weather_cache table. max_age is in seconds;
+        None means a cached response never goes stale.
+        """
+        cache_key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        now = datetime.now()
+
+        with _DB_LOCK:
+            row = self.conn.execute(
+                "SELECT fetched_at, json_body FROM weather_cache WHERE cache_key = ?",
+                (cache_key,),
+            ).fetchone()
+        if row:
+            age = (now - datetime.fromisoformat(row[0])).total_seconds()
+            if max_age is None or age < max_age:
+                # A corrupt row is a cache miss; the fetch below replaces it
+                try:
+                    data = json_loads(zlib.decompress(row[1]))
+                except (zlib.error, ValueError):
+                    self.logger.warning("Discarding unreadable cached response for %s", url)
+                else:
+                    self.logger.debug("Using cached response for %s", url)
+                    return data
+
+        response = self.session.get(url, timeout=OPEN_METEO["timeout"])
+        response.raise_for_status()
+        data = json_loads(response.content)
+
+        cutoff = now - timedelta(days=OPEN_METEO["cache_keep_days"])
+        with _DB_LOCK:
+            self.conn.execute("DELETE FROM weather_cache WHERE fetched_at < ?",
+                              (cutoff.isoformat(),))
+            self.conn.execute(
+                "INSERT OR REPLACE INTO weather_cache (cache_key, fetched_at, json_body) "
+                "VALUES (?, ?, ?)",
+                (cache_key, now.isoformat(),
+                 zlib.compress(response.content, OPEN_METEO["cache_compress_level"])),
+            )
+            self.conn.commit()
+        return data
+
     def fetch_historical(self, start_date, end_date):
         """Fetch historical daily weather from Open-Meteo Archive API."""
-        params = {
-            "latitude": LOCATION["latitude"],
-            "longitude": LOCATION["longitude"],
-            "start_date": start_date,
-            "end_date": end_date,
-            "daily": "temperature_2m_max,temperature_2m_min,precipitation_sum",
-            "temperature_unit": "fahrenheit",
-            "precipitation_unit": "inch",
-            "timezone": LOCATION["timezone"],
-        }
+        url = (f"{OPEN_METEO['archive_url']}?{OPEN_METEO_QUERY}"
+               f"&start_date={start_date}&end_date={end_date}")
 
         try:
-            response = self.session.get(
-                "https://archive-api.open-meteo.com/v1/archive",
-                params=params, timeout=30,
-            )
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            return self._get_json(url, max_age=None)
+        except HTTP_ERRORS as e:
             self.logger.error("Failed to fetch historical data: %s", e)
             return None
 
     def fetch_recent_and_forecast(self):
         """Fetch recent days + forecast from Open-Meteo."""
-        params = {
-            "latitude": LOCATION["latitude"],
-            "longitude": LOCATION["longitude"],
-            "daily": "temperature_2m_max,temperature_2m_min,precipitation_sum",
-            "temperature_unit": "fahrenheit",
-            "precipitation_unit": "inch",
-            "timezone": LOCATION["timezone"],
-            "past_days": 14,
-            "forecast_days": 16,
-        }
+        url = (f"{OPEN_METEO['forecast_url']}?{OPEN_METEO_QUERY}"
+               f"&past_days={OPEN_METEO['past_days']}"
+               f"&forecast_days={OPEN_METEO['forecast_days']}")
 
         try:
-            response = self.session.get(
-                "https://api.open-meteo.com/v1/forecast",
-                params=params, timeout=30,
-            )
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
+            return self._get_json(url, max_age=OPEN_METEO["forecast_cache_seconds"])
+        except HTTP_ERRORS as e:
             self.logger.error("Failed to fetch forecast data: %s", e)
             return None
 
@@ -347,108 +772,157 @@ class GDDWeedAlert:
             self.logger.warning("No data in weather response")
             return 0
 
-        c = self.conn.cursor()
-        rows_added = 0
-
-        for i, date_str in enumerate(dates):
-            tmax = tmaxs[i] if i < len(tmaxs) else None
-            tmin = tmins[i] if i < len(tmins) else None
-            precip = precips[i] if i < len(precips) else None
-
+        # Walk the column arrays in lockstep; a short array reads as None
+        rows = []
+        for date_str, tmin, tmax, precip in zip_longest(dates, tmins, tmaxs, precips):
+            if date_str is None:  # value arrays longer than "time"
+                break
             if tmax is None or tmin is None:
                 continue
 
-            tmean = (tmax + tmin) / 2.0
-            gdd50 = max(0.0, tmean - GDD_BASES["GDD50"])
-            gdd32 = max(0.0, tmean - GDD_BASES["GDD32"])
+            gdd50, gdd32 = compute_gdd_columns(tmin, tmax)
+            rows.append((date_str, tmin, tmax, precip, gdd50, gdd32))
 
-            c.execute("""
+        # One insert statement and the derived-column pass share a single
+        # transaction (one commit per ingest). Rows go in key order so the
+        # date B-tree is filled by appends rather than splits.
+        rows.sort()
+        with self.conn:
+            self.conn.executemany("""
                 INSERT OR REPLACE INTO daily_weather
-                (date, tmin_f, tmax_f, tmean_f, precip_in, gdd50, gdd32)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (date_str, tmin, tmax, tmean, precip, gdd50, gdd32))
-            rows_added += 1
+                (date, tmin_f, tmax_f, precip_in, gdd50, gdd32)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, rows)
 
-        self.conn.commit()
-        self.logger.debug("Stored %d days of weather data", rows_added)
-
-        # Now compute cumulative GDD and rolling averages
-        self._compute_cumulative_gdd()
-        self._compute_rolling_averages()
+            # Now compute cumulative GDD and rolling averages. Totals before
+            # the earliest stored date's year, and windows before that date,
+            # are unaffected by this payload.
+            if rows:
+                self._recompute_derived(since=rows[0][0])
 
+        rows_added = len(rows)
+        self.logger.debug("Stored %d days of weather data", rows_added)
         return rows_added
 
-    def _compute_cumulative_gdd(self):
-        """Compute cumulative GDD from Jan 1 of each year."""
-        c = self.conn.cursor()
-
-        # Get all years in the data
-        c.execute("SELECT DISTINCT substr(date, 1, 4) FROM daily_weather ORDER BY 1")
-        years = [row[0] for row in c.fetchall()]
-
-        for year in years:
-            c.execute("""
-                SELECT date, gdd50, gdd32 FROM daily_weather
-                WHERE date >= ? AND date <= ?
-                ORDER BY date
-            """, (f"{year}-01-01", f"{year}-12-31"))
-
-            cum50 = 0.0
-            cum32 = 0.0
-            for date_str, gdd50, gdd32 in c.fetchall():
-                cum50 += (gdd50 or 0)
-                cum32 += (gdd32 or 0)
-                c.execute("""
-                    UPDATE daily_weather SET cum_gdd50 = ?, cum_gdd32 = ?
-                    WHERE date = ?
-                """, (cum50, cum32, date_str))
-
-        self.conn.commit()
+    def _recompute_derived(self, since=None):
+        """
+        Recompute the derived columns in one pass: cumulative GDD from Jan 1
+        of each year, the 5-day rolling avg temp and the 2-day rain sum.
+        With `since`, only rows from that date on are rewritten. Totals
+        continue from the stored total of the last earlier day in the same
+        year, and the 4 rows before `since` are read just to seed the
+        windows, so a daily run touches the ~30 fetched days rather than
+        the year to date. Does not commit; runs inside calculate_and_store's
+        transaction.
+        """
+        since = since or ""
+        since_year = since[:4]
+        # Running totals as of the day before `since` (0 on/before Jan 1)
+        seed = self.conn.execute("""
+            SELECT COALESCE(cum_gdd50, 0), COALESCE(cum_gdd32, 0) FROM daily_weather
+            WHERE date >= ? AND date < ?
+            ORDER BY date DESC LIMIT 1
+        """, (since_year + "-01-01", since)).fetchone() or (0.0, 0.0)
+
+        if SQLITE_HAS_UPDATE_FROM:
+            # All four windows over one scan from 4 rows before `since`
+            # (fewer just means a shorter first window). The window seed rows
+            # are left out of the running totals, which instead start from
+            # the stored seed in the first year.
+            self.conn.execute("""
+                UPDATE daily_weather AS d
+                SET cum_gdd50 = t.c50, cum_gdd32 = t.c32,
+                    avg_temp_5day = t.avg5, rain_2day_sum = t.rain2
+                FROM (
+                    SELECT date,
+                           SUM(IIF(date >= :since, COALESCE(gdd50, 0), 0)) OVER yr
+                               + IIF(substr(date, 1, 4) = :year, :seed50, 0) AS c50,
+                           SUM(IIF(date >= :since, COALESCE(gdd32, 0), 0)) OVER yr
+                               + IIF(substr(date, 1, 4) = :year, :seed32, 0) AS c32,
+                           AVG(COALESCE(tmean_f, 0)) OVER w5 AS avg5,
+                           SUM(COALESCE(precip_in, 0)) OVER w2 AS rain2
+                    FROM daily_weather
+                    WHERE date >= COALESCE((
+                        SELECT date FROM daily_weather WHERE date < :since
+                        ORDER BY date DESC LIMIT 1 OFFSET 3
+                    ), '')
+                    WINDOW yr AS (PARTITION BY substr(date, 1, 4) ORDER BY date),
+                           w5 AS (ORDER BY date ROWS BETWEEN 4 PRECEDING AND CURRENT ROW),
+                           w2 AS (ORDER BY date ROWS BETWEEN 1 PRECEDING AND CURRENT ROW)
+                ) AS t
+                WHERE d.date = t.date AND t.date >= :since
+            """, {"since": since, "year": since_year, "seed50": seed[0], "seed32": seed[1]})
+            return
 
-    def _compute_rolling_averages(self):
-        """Compute 5-day rolling avg temp and 2-day rain sum."""
         c = self.conn.cursor()
-        c.execute("SELECT date, tmean_f, precip_in FROM daily_weather ORDER BY date")
+        c.execute("""
+            SELECT date, tmean_f, precip_in FROM daily_weather
+            WHERE date < ? ORDER BY date DESC LIMIT 4
+        """, (since,))
+        window_seed = c.fetchall()
+        window_seed.reverse()
+        c.execute("""
+            SELECT date, tmean_f, precip_in, gdd50, gdd32 FROM daily_weather
+            WHERE date >= ? ORDER BY date
+        """, (since,))
         rows = c.fetchall()
+        if not rows:
+            return
 
-        temps = []
-        precips_list = []
-
-        for date_str, tmean, precip in rows:
-            temps.append((date_str, tmean or 0))
-            precips_list.append((date_str, precip or 0))
-
-        # 5-day avg temp
-        for i in range(len(temps)):
-            window = temps[max(0, i-4):i+1]
-            avg5 = sum(t for _, t in window) / len(window)
-            c.execute("UPDATE daily_weather SET avg_temp_5day = ? WHERE date = ?",
-                      (avg5, temps[i][0]))
-
-        # 2-day rain sum
-        for i in range(len(precips_list)):
-            window = precips_list[max(0, i-1):i+1]
-            rain2 = sum(p for _, p in window)
-            c.execute("UPDATE daily_weather SET rain_2day_sum = ? WHERE date = ?",
-                      (rain2, precips_list[i][0]))
-
-        self.conn.commit()
+        # Running totals per year over the rewritten rows only
+        cum50, cum32 = [], []
+        for year, year_rows in groupby(rows, key=lambda row: row[0][:4]):
+            gdd50s, gdd32s = zip(*(row[3:] for row in year_rows))
+            start50, start32 = seed if year == since_year else (0.0, 0.0)
+            cum50.extend(islice(accumulate((g or 0 for g in gdd50s), initial=start50), 1, None))
+            cum32.extend(islice(accumulate((g or 0 for g in gdd32s), initial=start32), 1, None))
+
+        # Prefix sums (padded with a leading zero) so each window sum is a
+        # single subtraction: sum(x[i-w+1..i]) = cs[i+1] - cs[i+1-w]
+        offset = len(window_seed)
+        window_rows = window_seed + [row[:3] for row in rows]
+        temp_cs = array("d", [0.0])
+        temp_cs.extend(accumulate(row[1] or 0 for row in window_rows))
+        rain_cs = array("d", [0.0])
+        rain_cs.extend(accumulate(row[2] or 0 for row in window_rows))
+
+        updates = []
+        for j, row in enumerate(rows):
+            i = j + offset
+            start5 = max(0, i - 4)
+            avg5 = (temp_cs[i + 1] - temp_cs[start5]) / (i + 1 - start5)
+            rain2 = rain_cs[i + 1] - rain_cs[max(0, i - 1)]
+            updates.append((cum50[j], cum32[j], avg5, rain2, row[0]))
+
+        c.executemany("""
+            UPDATE daily_weather
+            SET cum_gdd50 = ?, cum_gdd32 = ?, avg_temp_5day = ?, rain_2day_sum = ?
+            WHERE date = ?
+        """, updates)
 
     # -------------------------------------------------------------------------
     # Alert Deduplication
     # -------------------------------------------------------------------------
 
-    def _is_alert_sent(self, alert_key):
-        c = self.conn.cursor()
-        c.execute("SELECT 1 FROM alerts_sent WHERE alert_key = ?", (alert_key,))
-        return c.fetchone() is not None
+    def _sent_alert_keys(self):
+        """Return the set of every alert key already recorded as sent."""
+        return {key for (key,) in self.conn.execute("SELECT alert_key FROM alerts_sent")}
 
-    def _record_alert(self, alert_key, message):
-        c = self.conn.cursor()
-        c.execute("""
-            INSERT OR REPLACE INTO alerts_sent (alert_key, sent_at, message)
+    def _claim_alert(self, alert_key, message):
+        """
+        Record alert_key as sent unless it already is. Returns True only if
+        this call inserted the row, i.e. the alert has not gone out before.
+        """
+        c = self.conn.execute("""
+            INSERT OR IGNORE INTO alerts_sent (alert_key, sent_at, message)
             VALUES (?, ?, ?)
-        """, (alert_key, datetime.now().isoformat(), message))
+        """, (alert_key, int(time.time()), message))
+        self.conn.commit()
+        return c.rowcount == 1
+
+    def _release_alert(self, alert_key):
+        """Drop the claim for an alert that failed to send, so it is retried."""
+        self.conn.execute("DELETE FROM alerts_sent WHERE alert_key = ?", (alert_key,))
         self.conn.commit()
 
     # -------------------------------------------------------------------------
@@ -457,42 +931,31 @@ class GDDWeedAlert:
 
     def _get_recent_data(self, days=14):
         """Get the most recent N days of weather data."""
-        c = self.conn.cursor()
-        c.execute("""
-            SELECT date, tmin_f, tmax_f, tmean_f, precip_in, gdd50, gdd32,
-                   cum_gdd50, cum_gdd32, avg_temp_5day, rain_2day_sum
-            FROM daily_weather
-            ORDER BY date DESC
-            LIMIT ?
-        """, (days,))
-        rows = c.fetchall()
-        rows.reverse()  # Chronological order
-        return rows
+        # Newest N by the PK walked backwards, then back to chronological
+        # order inside SQLite; the outer sort is over N rows only
+        return self.conn.execute(f"""
+            SELECT * FROM (
+                SELECT {DAILY_WEATHER_ROW_COLUMNS}
+                FROM daily_weather
+                ORDER BY date DESC
+                LIMIT ?
+            ) ORDER BY date
+        """, (days,)).fetchall()
 
     def _get_today_data(self):
         """Get today's data row."""
         today = datetime.now().strftime("%Y-%m-%d")
-        c = self.conn.cursor()
-        c.execute("SELECT * FROM daily_weather WHERE date = ?", (today,))
-        return c.fetchone()
-
-    def _get_latest_data(self):
-        """Get the most recent data row we have."""
-        c = self.conn.cursor()
-        c.execute("SELECT * FROM daily_weather ORDER BY date DESC LIMIT 1")
-        return c.fetchone()
-
-    def _day_name(self, date_str):
-        return datetime.strptime(date_str, "%Y-%m-%d").strftime("%A")
-
-    def _format_date(self, date_str):
-        """Format date as 'Monday, Feb 23'."""
-        dt = datetime.strptime(date_str, "%Y-%m-%d")
-        return dt.strftime("%A, %b %d").replace(" 0", " ")
-
-    def _short_date(self, date_str):
+        return self.conn.execute(
+            f"SELECT {DAILY_WEATHER_ROW_COLUMNS} FROM daily_weather WHERE date = ?",
+            (today,)).fetchone()
+
+    # Every spray-window message shortens the same few dates, so results
+    # are cached per date string
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _short_date(date_str):
         """Format date as 'Feb 23' (compact for SMS)."""
-        dt = datetime.strptime(date_str, "%Y-%m-%d")
+        dt = datetime.fromisoformat(date_str)
         return dt.strftime("%b %d").replace(" 0", " ")
 
     def _estimate_spray_date(self, sprouting_date_str, spray_window_days):
@@ -502,7 +965,7 @@ class GDDWeedAlert:
         Cooler weather = slower growth = spray later (closer to 21 days).
         Returns (early_date_str, late_date_str) for spray window.
         """
-        sprouting_date = datetime.strptime(sprouting_date_str, "%Y-%m-%d")
+        sprouting_date = datetime.fromisoformat(sprouting_date_str)
 
         # Look at forecast temps to estimate growth speed
         recent = self._get_recent_data(30)
@@ -513,12 +976,10 @@ class GDDWeedAlert:
             late = sprouting_date + timedelta(days=spray_window_days)
             return early.strftime("%Y-%m-%d"), late.strftime("%Y-%m-%d")
 
-        # Get upcoming average temps (use forecast data)
-        upcoming_temps = []
-        for row in recent:
-            row_date = datetime.strptime(row[0], "%Y-%m-%d")
-            if row_date >= sprouting_date and row[3] is not None:
-                upcoming_temps.append(row[3])
+        # Get upcoming average temps (use forecast data). Dates are ISO
+        # strings, which order the same as the dates they encode.
+        upcoming_temps = [row[3] for row in recent
+                          if row[0] >= sprouting_date_str and row[3] is not None]
 
         if not upcoming_temps:
             upcoming_temps = [row[3] for row in recent[-7:] if row[3] is not None]
@@ -547,8 +1008,7 @@ class GDDWeedAlert:
         """Record a sprouting event and schedule the follow-up spray alert."""
         early, late = self._estimate_spray_date(sprouting_date, spray_window_days)
 
-        c = self.conn.cursor()
-        c.execute("""
+        self.conn.execute("""
             INSERT OR REPLACE INTO spray_schedule
             (trigger_key, sprouting_date, spray_date_early, spray_date_late,
              spray_alert_sent, trigger_name, weeds, action)
@@ -558,32 +1018,32 @@ class GDDWeedAlert:
 
         return early, late
 
-    def check_spray_windows(self):
+    def check_spray_windows(self, now):
         """
-        Phase 2: Check if any scheduled spray windows have arrived.
-        Returns list of (alert_key, message) tuples.
+        Phase 2: Check if any scheduled spray windows have arrived as of
+        `now`. Returns list of (alert_key, message) tuples, skipping windows
+        whose alert is already in alerts_sent. Not wired into
+        run_daily_check yet: nothing calls _schedule_spray.
         """
         alerts = []
-        today = datetime.now().strftime("%Y-%m-%d")
-
-        c = self.conn.cursor()
-        c.execute("""
-            SELECT trigger_key, sprouting_date, spray_date_early, spray_date_late,
-                   trigger_name, weeds, action
-            FROM spray_schedule
-            WHERE spray_alert_sent = 0 AND spray_date_early <= ?
-        """, (today,))
-
-        for row in c.fetchall():
+        today = now.strftime("%Y-%m-%d")
+
+        # The alerts_sent lookup is a probe of its alert_key primary key
+        scheduled = self.conn.execute("""
+            SELECT s.trigger_key, s.sprouting_date, s.spray_date_early, s.spray_date_late,
+                   s.trigger_name, s.weeds, s.action
+            FROM spray_schedule AS s
+            LEFT JOIN alerts_sent AS a ON a.alert_key = 'spray_' || s.trigger_key
+            WHERE s.spray_alert_sent = 0 AND s.spray_date_early <= ?
+              AND a.alert_key IS NULL
+        """, (today,)).fetchall()
+
+        for row in scheduled:
             trigger_key, sprout_date, early, late, name, weeds, action = row
             alert_key = f"spray_{trigger_key}"
 
-            if self._is_alert_sent(alert_key):
-                continue
-
-            days_since = (datetime.now() - datetime.strptime(sprout_date, "%Y-%m-%d")).days
-            late_date = datetime.strptime(late, "%Y-%m-%d")
-            days_left = (late_date - datetime.now()).days
+            days_since = (now - datetime.fromisoformat(sprout_date)).days
+            days_left = (datetime.fromisoformat(late) - now).days
 
             if days_left < 0:
                 urgency = "OVERDUE"
@@ -594,93 +1054,91 @@ class GDDWeedAlert:
 
             # Truncate weeds list for SMS
             short_weeds = ", ".join(weeds.split(", ")[:4])
-            msg = (
-                f"SPRAY NOW: {name}\n"
-                f"{urgency} {days_since}d since sprout\n"
-                f"Weeds: {short_weeds}\n"
-                f"Spray by: {self._short_date(late)}"
-            )
-            alerts.append((alert_key, msg))
-
-            # Mark spray alert as sent
-            c.execute("UPDATE spray_schedule SET spray_alert_sent = 1 WHERE trigger_key = ?",
-                      (trigger_key,))
+            alerts.extend(self._format_alerts(
+                alert_key, "spray_now", name=name, urgency=urgency,
+                days=days_since, weeds=short_weeds, spray_by=self._short_date(late)))
+
+        # Mark every window handled above as sent in one statement and commit
+        if scheduled:
+            self.conn.executemany(
+                "UPDATE spray_schedule SET spray_alert_sent = 1 WHERE trigger_key = ?",
+                [(row[0],) for row in scheduled])
             self.conn.commit()
 
         return alerts
 
-    def check_fall_pre(self):
+    def _spray_window_alerts(self, now, trigger_key, alert_key, **fields):
+        """
+        Estimate the spray window for TRIGGERS[trigger_key] from today and
+        return its formatted ALERT_MESSAGES[trigger_key] pair.
+        """
+        early, late = self._estimate_spray_date(
+            now.strftime("%Y-%m-%d"), TRIGGERS[trigger_key]["spray_window_days"])
+        return self._format_alerts(alert_key, trigger_key, early=early, late=late, **fields)
+
+    def _format_alerts(self, alert_key, template_key, early=None, late=None, **fields):
+        """
+        Fill in ALERT_MESSAGES[template_key] and return the (alert_key,
+        message) pairs a check hands to run_daily_check. early/late are
+        spray-window dates, shortened here.
+        """
+        if early is not None:
+            fields["early"] = self._short_date(early)
+            fields["late"] = self._short_date(late)
+        templates = ALERT_MESSAGES[template_key]
+        if len(templates) == 1:
+            return [(alert_key, templates[0].format(**fields))]
+        sprout_msg, spray_msg = templates
+        return [(f"{alert_key}_sprout", sprout_msg.format(**fields)),
+                (f"{alert_key}_spray", spray_msg.format(**fields))]
+
+    def check_fall_pre(self, now, recent):
         """
         FALL PRE-EMERGENT trigger:
         5-day avg temp drops below 70F AND 2-day rain sum >= 0.25 inches.
         Active Sep-Oct. Sends sprouting + spray-by alerts together.
         """
-        current_month = datetime.now().month
-        if current_month not in TRIGGERS["fall_pre"]["season_months"]:
+        if now.month not in TRIGGER_SEASONS["fall_pre"]:
             return []
 
-        recent = self._get_recent_data(7)
-        if len(recent) < 5:
+        conds = TRIGGERS["fall_pre"]["conditions"]
+
+        # Only the rolling window's worth of rows is needed
+        recent = recent[-conds["avg_temp_window"]:]
+        if len(recent) < conds["avg_temp_window"]:
             return []
 
         latest = recent[-1]
         avg_temp_5day = latest[9]
         rain_2day = latest[10]
 
-        trigger = TRIGGERS["fall_pre"]
-        conds = trigger["conditions"]
-
         if (avg_temp_5day is not None and avg_temp_5day <= conds["avg_temp_below"]
                 and rain_2day is not None and rain_2day >= conds["rain_2day_min"]):
 
-            year = datetime.now().year
+            year = now.year
             alert_key = f"fall_pre_{year}"
-            if self._is_alert_sent(alert_key):
-                return []
 
-            today = datetime.now().strftime("%Y-%m-%d")
-            early, late = self._estimate_spray_date(today, trigger["spray_window_days"])
-
-            msg1 = (
-                f"SPROUTING: Fall Weeds\n"
-                f"5d Avg {avg_temp_5day:.0f}F | Rain {rain_2day:.2f}in\n"
-                f"Weeds: chickweed, henbit, mustards, Poa annua"
-            )
-            msg2 = (
-                f"SPRAY BY: Fall PRE-Emergent\n"
-                f"Spray {self._short_date(early)}-{self._short_date(late)}\n"
-                f"Apply PRE on clean soil before germination"
-            )
-            return [(f"{alert_key}_sprout", msg1), (f"{alert_key}_spray", msg2)]
+            return self._spray_window_alerts(
+                now, "fall_pre", alert_key,
+                avg_temp=avg_temp_5day, rain=rain_2day)
 
         return []
 
-    def check_late_winter_post(self):
+    def check_late_winter_post(self, now, recent):
         """
         LATE WINTER trigger:
         5+ consecutive days with avg temp > 45F AND cumulative GDD32 >= 200.
         Active Apr-May. Winter annuals resuming growth.
         """
-        current_month = datetime.now().month
-        if current_month not in TRIGGERS["late_winter_post"]["season_months"]:
+        if now.month not in TRIGGER_SEASONS["late_winter_post"]:
             return []
 
-        recent = self._get_recent_data(14)
         if len(recent) < 5:
             return []
 
-        trigger = TRIGGERS["late_winter_post"]
-        conds = trigger["conditions"]
+        conds = TRIGGERS["late_winter_post"]["conditions"]
 
-        consecutive = 0
-        max_consecutive = 0
-        for row in recent:
-            tmean = row[3]
-            if tmean is not None and tmean >= conds["warm_day_threshold"]:
-                consecutive += 1
-                max_consecutive = max(max_consecutive, consecutive)
-            else:
-                consecutive = 0
+        max_consecutive = longest_warm_streak(recent, conds["warm_day_threshold"])
 
         latest = recent[-1]
         cum_gdd32 = latest[8]
@@ -688,220 +1146,134 @@ class GDDWeedAlert:
         if (max_consecutive >= conds["consecutive_warm_days"]
                 and cum_gdd32 is not None and cum_gdd32 >= conds["gdd32_min"]):
 
-            year = datetime.now().year
+            year = now.year
             alert_key = f"late_winter_{year}"
-            if self._is_alert_sent(alert_key):
-                return []
 
-            today = datetime.now().strftime("%Y-%m-%d")
-            early, late = self._estimate_spray_date(today, trigger["spray_window_days"])
-
-            msg1 = (
-                f"SPROUTING: Winter Weeds\n"
-                f"{max_consecutive}d >{conds['warm_day_threshold']:.0f}F | GDD32: {cum_gdd32:.0f}\n"
-                f"Weeds: chickweed, henbit, shepherd purse"
-            )
-            msg2 = (
-                f"SPRAY BY: Winter Weeds\n"
-                f"Spray {self._short_date(early)}-{self._short_date(late)}\n"
-                f"Spot-spray POST while weeds <6in"
-            )
-            return [(f"{alert_key}_sprout", msg1), (f"{alert_key}_spray", msg2)]
+            return self._spray_window_alerts(
+                now, "late_winter_post", alert_key,
+                days=max_consecutive, threshold=conds["warm_day_threshold"],
+                gdd=cum_gdd32)
 
         return []
 
-    def check_spring_pre(self):
+    def check_spring_pre(self, now, recent):
         """
         SPRING PRE-EMERGENT trigger (3-tier):
         GDD50 approaching crabgrass germination threshold.
         125 = Heads-up, 150 = Apply PRE now, 200 = Germination started.
         Active Apr-May.
         """
-        current_month = datetime.now().month
-        if current_month not in TRIGGERS["spring_pre"]["season_months"]:
+        if now.month not in TRIGGER_SEASONS["spring_pre"]:
             return []
 
-        latest = self._get_latest_data()
-        if not latest:
+        if not recent:
             return []
 
-        cum_gdd50 = latest[7]
+        cum_gdd50 = recent[-1][7]
         if cum_gdd50 is None:
             return []
 
-        trigger = TRIGGERS["spring_pre"]
-        conds = trigger["conditions"]
-        year = datetime.now().year
+        conds = TRIGGERS["spring_pre"]["conditions"]
+        year = now.year
 
         # Tier 3: Germination started
         if cum_gdd50 >= conds["gdd50_germination"]:
             alert_key = f"spring_pre_{year}"
-            if self._is_alert_sent(alert_key):
-                return []
-
-            today = datetime.now().strftime("%Y-%m-%d")
-            early, late = self._estimate_spray_date(today, trigger["spray_window_days"])
 
-            msg1 = (
-                f"SPROUTING: Crabgrass/Foxtail\n"
-                f"GDD50: {cum_gdd50:.0f} (sprout at {conds['gdd50_germination']})\n"
-                f"PRE window passed, use POST"
-            )
-            msg2 = (
-                f"SPRAY BY: Crabgrass/Foxtail\n"
-                f"Spray {self._short_date(early)}-{self._short_date(late)}\n"
-                f"POST on small seedlings (2-6 leaf)"
-            )
-            return [(f"{alert_key}_sprout", msg1), (f"{alert_key}_spray", msg2)]
+            return self._spray_window_alerts(
+                now, "spring_pre", alert_key,
+                gdd=cum_gdd50, germination=conds["gdd50_germination"])
 
         # Tier 2: Apply PRE now (before germination)
         elif cum_gdd50 >= conds["gdd50_apply_by"]:
             alert_key = f"spring_pre_applyby_{year}"
-            if self._is_alert_sent(alert_key):
-                return []
-            msg1 = (
-                f"SPROUTING SOON: Crabgrass/Foxtail\n"
-                f"GDD50: {cum_gdd50:.0f} | Sprout at {conds['gdd50_germination']}\n"
-                f"Not sprouted yet"
-            )
-            msg2 = (
-                f"APPLY PRE NOW!\n"
-                f"Weeds: crabgrass, foxtail\n"
-                f"Apply PRE before GDD50 hits {conds['gdd50_germination']}"
-            )
-            return [(f"{alert_key}_sprout", msg1), (f"{alert_key}_spray", msg2)]
+            return self._format_alerts(
+                alert_key, "spring_pre_applyby",
+                gdd=cum_gdd50, germination=conds["gdd50_germination"])
 
         # Tier 1: Heads-up (plan your application)
         elif cum_gdd50 >= conds["gdd50_headsup"]:
             alert_key = f"spring_pre_headsup_{year}"
-            if self._is_alert_sent(alert_key):
-                return []
-            msg = (
-                f"HEADS UP: PRE-Emergent Soon\n"
-                f"GDD50: {cum_gdd50:.0f} | Apply by {conds['gdd50_apply_by']}\n"
-                f"Weeds: crabgrass, foxtail\n"
-                f"Plan application now"
-            )
-            return [(alert_key, msg)]
+            return self._format_alerts(
+                alert_key, "spring_pre_headsup",
+                gdd=cum_gdd50, apply_by=conds["gdd50_apply_by"])
 
         return []
 
-    def check_spring_broadleaf(self):
+    def check_spring_broadleaf(self, now, recent):
         """
         SPRING BROADLEAF FLUSH trigger:
         GDD50 reaching warm-season broadleaf emergence thresholds.
         Active Apr-May.
         """
-        current_month = datetime.now().month
-        if current_month not in TRIGGERS["spring_broadleaf"]["season_months"]:
+        if now.month not in TRIGGER_SEASONS["spring_broadleaf"]:
             return []
 
-        latest = self._get_latest_data()
-        if not latest:
+        if not recent:
             return []
 
-        cum_gdd50 = latest[7]
+        cum_gdd50 = recent[-1][7]
         if cum_gdd50 is None:
             return []
 
-        trigger = TRIGGERS["spring_broadleaf"]
-        conds = trigger["conditions"]
-        year = datetime.now().year
+        conds = TRIGGERS["spring_broadleaf"]["conditions"]
+        year = now.year
 
         if cum_gdd50 >= conds["gdd50_emergence"]:
             alert_key = f"spring_broadleaf_{year}"
-            if self._is_alert_sent(alert_key):
-                return []
-
-            today = datetime.now().strftime("%Y-%m-%d")
-            early, late = self._estimate_spray_date(today, trigger["spray_window_days"])
 
-            msg1 = (
-                f"SPROUTING: Broadleaf Weeds\n"
-                f"GDD50: {cum_gdd50:.0f} (threshold {conds['gdd50_emergence']})\n"
-                f"Weeds: pigweed, ragweed, spurge"
-            )
-            msg2 = (
-                f"SPRAY BY: Broadleaf Weeds\n"
-                f"Spray {self._short_date(early)}-{self._short_date(late)}\n"
-                f"POST while seedlings small (2-6 leaf)"
-            )
-            return [(f"{alert_key}_sprout", msg1), (f"{alert_key}_spray", msg2)]
+            return self._spray_window_alerts(
+                now, "spring_broadleaf", alert_key,
+                gdd=cum_gdd50, emergence=conds["gdd50_emergence"])
 
         return []
 
-    def check_perennial_fall(self):
+    def check_perennial_fall(self, now, recent):
         """
         PERENNIAL FALL ROSETTE trigger:
         Temps cooling, perennials forming rosettes for winter.
         Active Sep-Oct.
         """
-        current_month = datetime.now().month
-        if current_month not in TRIGGERS["perennial_fall"]["season_months"]:
+        if now.month not in TRIGGER_SEASONS["perennial_fall"]:
             return []
 
-        recent = self._get_recent_data(10)
-        if len(recent) < 7:
-            return []
+        conds = TRIGGERS["perennial_fall"]["conditions"]
 
-        trigger = TRIGGERS["perennial_fall"]
-        conds = trigger["conditions"]
+        recent = recent[-conds["avg_temp_window"]:]
+        if len(recent) < conds["avg_temp_window"]:
+            return []
 
-        last7_temps = [r[3] for r in recent[-7:] if r[3] is not None]
+        last7_temps = [r[3] for r in recent if r[3] is not None]
         if not last7_temps:
             return []
 
         avg7 = sum(last7_temps) / len(last7_temps)
 
         if avg7 <= conds["avg_temp_below"]:
-            year = datetime.now().year
+            year = now.year
             alert_key = f"perennial_fall_{year}"
-            if self._is_alert_sent(alert_key):
-                return []
 
-            today = datetime.now().strftime("%Y-%m-%d")
-            early, late = self._estimate_spray_date(today, trigger["spray_window_days"])
-
-            msg1 = (
-                f"SPROUTING: Fall Perennials\n"
-                f"7d Avg {avg7:.0f}F - rosettes forming\n"
-                f"Weeds: dandelion, dock, thistle, plantain"
-            )
-            msg2 = (
-                f"SPRAY BY: Fall Perennials\n"
-                f"Spray {self._short_date(early)}-{self._short_date(late)}\n"
-                f"Treat rosettes before dormancy"
-            )
-            return [(f"{alert_key}_sprout", msg1), (f"{alert_key}_spray", msg2)]
+            return self._spray_window_alerts(
+                now, "perennial_fall", alert_key,
+                avg_temp=avg7)
 
         return []
 
-    def check_perennial_spring(self):
+    def check_perennial_spring(self, now, recent):
         """
         PERENNIAL SPRING ROSETTE trigger:
         Warming temps, perennials resuming growth.
         Active Apr-May.
         """
-        current_month = datetime.now().month
-        if current_month not in TRIGGERS["perennial_spring"]["season_months"]:
+        if now.month not in TRIGGER_SEASONS["perennial_spring"]:
             return []
 
-        recent = self._get_recent_data(14)
         if len(recent) < 7:
             return []
 
-        trigger = TRIGGERS["perennial_spring"]
-        conds = trigger["conditions"]
+        conds = TRIGGERS["perennial_spring"]["conditions"]
 
-        consecutive = 0
-        max_consecutive = 0
-        for row in recent:
-            tmean = row[3]
-            if tmean is not None and tmean >= conds["warm_day_threshold"]:
-                consecutive += 1
-                max_consecutive = max(max_consecutive, consecutive)
-            else:
-                consecutive = 0
+        max_consecutive = longest_warm_streak(recent, conds["warm_day_threshold"])
 
         latest = recent[-1]
         cum_gdd50 = latest[7]
@@ -909,25 +1281,13 @@ class GDDWeedAlert:
         if (max_consecutive >= conds["consecutive_warm_days"]
                 and cum_gdd50 is not None and cum_gdd50 >= conds["gdd50_min"]):
 
-            year = datetime.now().year
+            year = now.year
             alert_key = f"perennial_spring_{year}"
-            if self._is_alert_sent(alert_key):
-                return []
 
-            today = datetime.now().strftime("%Y-%m-%d")
-            early, late = self._estimate_spray_date(today, trigger["spray_window_days"])
-
-            msg1 = (
-                f"SPROUTING: Spring Perennials\n"
-                f"{max_consecutive}d >{conds['warm_day_threshold']:.0f}F | GDD50: {cum_gdd50:.0f}\n"
-                f"Weeds: dandelion, dock, thistle, plantain"
-            )
-            msg2 = (
-                f"SPRAY BY: Spring Perennials\n"
-                f"Spray {self._short_date(early)}-{self._short_date(late)}\n"
-                f"Treat rosettes before bolting"
-            )
-            return [(f"{alert_key}_sprout", msg1), (f"{alert_key}_spray", msg2)]
+            return self._spray_window_alerts(
+                now, "perennial_spring", alert_key,
+                days=max_consecutive, threshold=conds["warm_day_threshold"],
+                gdd=cum_gdd50)
 
         return []
 
@@ -938,18 +1298,21 @@ class GDDWeedAlert:
     def send_alert(self, message):
         """Send SMS via Zapier webhook."""
         try:
+            # Compact separators: requests' json= encoding pads with spaces
+            body = json.dumps(
+                {"message": message, "phone": ZAPIER_CONFIG["phone_number"]},
+                separators=(",", ":"),
+            )
             response = self.session.post(
                 ZAPIER_CONFIG["webhook_url"],
-                json={
-                    "message": message,
-                    "phone": ZAPIER_CONFIG["phone_number"],
-                },
+                data=body.encode("utf-8"),
+                headers={"Content-Type": "application/json"},
                 timeout=15,
             )
             response.raise_for_status()
-            self.logger.info("Alert sent: %s", message[:80])
+            self.logger.info("Alert sent: %.80s", message)
             return True
-        except requests.RequestException as e:
+        except HTTP_ERRORS as e:
             self.logger.error("Failed to send alert: %s", e)
             return False
 
@@ -959,25 +1322,45 @@ class GDDWeedAlert:
 
     def backfill(self):
         """Backfill GDD data from Jan 1 of current year to yesterday."""
-        year = datetime.now().year
-        start = f"{year}-01-01"
-        # Use archive API for dates before ~5 days ago, forecast API for recent
-        five_days_ago = (datetime.now() - timedelta(days=5)).strftime("%Y-%m-%d")
-
-        self.logger.info("Backfilling from %s to %s...", start, five_days_ago)
-
-        data = self.fetch_historical(start, five_days_ago)
-        if data:
-            rows = self.calculate_and_store(data)
-            self.logger.info("Backfilled %d days from archive.", rows)
-        else:
-            self.logger.error("Failed to fetch historical data for backfill.")
-
-        # Also fetch recent + forecast
-        data = self.fetch_recent_and_forecast()
-        if data:
-            rows = self.calculate_and_store(data)
-            self.logger.info("Added %d days from recent/forecast.", rows)
+        now = datetime.now()
+        start = f"{now.year}-01-01"
+        # Archive for everything it has, forecast for the recent days. The
+        # ranges overlap on purpose: forecast rows overwrite archive rows,
+        # but a day the forecast returns nulls for keeps its archive values.
+        # In the first days of January the forecast's past_days covers it all.
+        archive_end = now - timedelta(days=OPEN_METEO["archive_lag_days"])
+        archive_end = (archive_end.strftime("%Y-%m-%d")
+                       if archive_end.year == now.year else None)
+
+        # The two requests are independent, so overlap their network time.
+        # Both complete before anything is written, so the fetch threads
+        # never touch the connection while calculate_and_store is using it.
+        historical = None
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            if archive_end is not None:
+                self.logger.info("Backfilling from %s to %s...", start, archive_end)
+                historical = pool.submit(self.fetch_historical, start, archive_end)
+            recent = pool.submit(self.fetch_recent_and_forecast)
+
+        # Keep dirty pages in the page cache until each bulk transaction
+        # commits instead of spilling them to the database file mid-write.
+        self.conn.execute("PRAGMA cache_spill=OFF")
+        try:
+            if historical is not None:
+                data = historical.result()
+                if data:
+                    rows = self.calculate_and_store(data)
+                    self.logger.info("Backfilled %d days from archive.", rows)
+                else:
+                    self.logger.error("Failed to fetch historical data for backfill.")
+
+            # Also store recent + forecast (after the archive, so it wins overlaps)
+            data = recent.result()
+            if data:
+                rows = self.calculate_and_store(data)
+                self.logger.info("Added %d days from recent/forecast.", rows)
+        finally:
+            self.conn.execute("PRAGMA cache_spill=ON")
 
     def run_daily_check(self):
         """Daily check: fetch weather, calculate GDD, check triggers, send alerts."""
@@ -991,34 +1374,40 @@ class GDDWeedAlert:
 
         self.calculate_and_store(data)
 
-        # Check if we have enough data (need backfill if this is first run)
-        c = self.conn.cursor()
-        c.execute("SELECT COUNT(*) FROM daily_weather")
-        count = c.fetchone()[0]
+        # Check if we have enough data (need backfill if this is first run).
+        # Only "fewer than 30 rows?" matters, so stop counting at 30 rather
+        # than walking the whole history.
+        count = self.conn.execute(
+            "SELECT COUNT(*) FROM (SELECT 1 FROM daily_weather LIMIT 30)").fetchone()[0]
         if count < 30:
             self.logger.info("Sparse data (%d days). Running backfill first...", count)
             self.backfill()
 
-        # Check all triggers - each returns list of (alert_key, message) pairs
-        # Sprouting + Spray-by texts are sent together immediately
-        all_checks = [
-            self.check_fall_pre,
-            self.check_late_winter_post,
-            self.check_spring_pre,
-            self.check_spring_broadleaf,
-            self.check_perennial_fall,
-            self.check_perennial_spring,
-        ]
-
+        # Check in-season triggers - each returns list of (alert_key, message)
+        # pairs; Sprouting + Spray-by texts are sent together immediately.
+        # All checks share one clock reading and one recent window, and in
+        # months with no trigger in season the window is not read at all.
+        now = datetime.now()
+        in_season = TRIGGERS_BY_MONTH[now.month]
+        recent = self._get_recent_data(RECENT_WINDOW_DAYS) if in_season else []
         sent_messages = []
-        for check_fn in all_checks:
-            alerts = check_fn()
+        sent_keys = None  # Read on the first fired alert, if any
+        for trigger_key in in_season:
+            alerts = TRIGGER_CHECKS[trigger_key](self, now, recent)
             for alert_key, message in alerts:
+                if sent_keys is None:
+                    sent_keys = self._sent_alert_keys()
+                # Known keys are skipped without a write. Otherwise claim the
+                # key before POSTing so a repeat run never texts twice.
+                if alert_key in sent_keys or not self._claim_alert(alert_key, message):
+                    self.logger.debug("Alert already sent: %s", alert_key)
+                    continue
                 self.logger.info("Alert triggered: %s", alert_key)
                 success = self.send_alert(message)
                 if success:
-                    self._record_alert(alert_key, message)
                     sent_messages.append(message)
+                else:
+                    self._release_alert(alert_key)
 
         if not sent_messages:
             self.logger.info("No weed alert triggers fired today.")
@@ -1028,101 +1417,69 @@ class GDDWeedAlert:
 
     def send_test_alerts(self):
         """Send test alert pairs: SPROUTING text + SPRAY BY text for each trigger."""
-        import time
-
         today = datetime.now()
         se = (today + timedelta(days=10)).strftime("%Y-%m-%d")
         sl = (today + timedelta(days=16)).strftime("%Y-%m-%d")
 
-        latest = self._get_latest_data()
-        cum_gdd32 = latest[8] if latest else 450
-
         # Each pair: (sprouting_msg, spray_by_msg)
         test_pairs = [
-            # FALL: Annuals
-            (
-                f"SPROUTING: Fall Weeds\n"
-                f"5d Avg 65F | Rain 0.48in\n"
-                f"Weeds: chickweed, henbit, mustards, Poa annua",
-                f"SPRAY BY: Fall PRE-Emergent\n"
-                f"Spray {self._short_date(se)}-{self._short_date(sl)}\n"
-                f"Apply PRE on clean soil before germination",
-            ),
-            # FALL: Perennials
-            (
-                f"SPROUTING: Fall Perennials\n"
-                f"7d Avg 62F - rosettes forming\n"
-                f"Weeds: dandelion, dock, thistle, plantain",
-                f"SPRAY BY: Fall Perennials\n"
-                f"Spray {self._short_date(se)}-{self._short_date(sl)}\n"
-                f"Treat rosettes before dormancy",
-            ),
-            # SPRING: Crabgrass/Foxtail
-            (
-                f"SPROUTING: Crabgrass/Foxtail\n"
-                f"GDD50: 205 (sprout at 200)\n"
-                f"PRE window passed, use POST",
-                f"SPRAY BY: Crabgrass/Foxtail\n"
-                f"Spray {self._short_date(se)}-{self._short_date(sl)}\n"
-                f"POST on small seedlings (2-6 leaf)",
-            ),
-            # SPRING: Broadleaf
-            (
-                f"SPROUTING: Broadleaf Weeds\n"
-                f"GDD50: 320 (threshold 300)\n"
-                f"Weeds: pigweed, ragweed, spurge",
-                f"SPRAY BY: Broadleaf Weeds\n"
-                f"Spray {self._short_date(se)}-{self._short_date(sl)}\n"
-                f"POST while seedlings small (2-6 leaf)",
-            ),
-            # SPRING: Perennials
-            (
-                f"SPROUTING: Spring Perennials\n"
-                f"7d >50F | GDD50: 120\n"
-                f"Weeds: dandelion, dock, thistle, plantain",
-                f"SPRAY BY: Spring Perennials\n"
-                f"Spray {self._short_date(se)}-{self._short_date(sl)}\n"
-                f"Treat rosettes before bolting",
-            ),
+            tuple(msg for _, msg in self._format_alerts(
+                f"test_{key}", key, early=se, late=sl, **fields))
+            for key, fields in TEST_ALERTS
         ]
 
+        # Sent one at a time so the texts arrive in pair order; each POST
+        # already waits for the webhook's response, so no extra pause
         total = len(test_pairs) * 2
+        sent = 0
         msg_num = 0
-        for sprout_msg, spray_msg in test_pairs:
-            msg_num += 1
-            print(f"\n--- {msg_num}/{total} SPROUTING ---")
-            print(sprout_msg)
-            self.send_alert(sprout_msg)
-            time.sleep(3)
-
-            msg_num += 1
-            print(f"\n--- {msg_num}/{total} SPRAY BY ---")
-            print(spray_msg)
-            self.send_alert(spray_msg)
-            time.sleep(3)
-
-        print(f"\nAll {total} test alerts sent!")
+        for pair in test_pairs:
+            for label, msg in zip(("SPROUTING", "SPRAY BY"), pair):
+                msg_num += 1
+                print(f"\n--- {msg_num}/{total} {label} ---")
+                print(msg)
+                if self.send_alert(msg):
+                    sent += 1
+                    print("Sent.")
+                else:
+                    print("Failed to send.")
+
+        print(f"\n{sent}/{total} test alerts sent!")
         print(f"{len(test_pairs)} pairs (SPROUTING + SPRAY BY each)")
 
-    def show_status(self):
-        """Display current GDD accumulation and trigger status."""
+    def show_status(self, alert_limit=20):
+        """
+        Display current GDD accumulation and trigger status, plus the
+        alert_limit most recently sent alerts.
+        """
         print(f"\n{'='*60}")
         print(f"  Degree Day Spray for Weeds - GDD-SIS Status")
         print(f"  Location: {LOCATION['name']}")
         print(f"  Time:     {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"{'='*60}\n")
 
-        c = self.conn.cursor()
-        c.execute("SELECT COUNT(*) FROM daily_weather")
-        total_days = c.fetchone()[0]
+        # One read serves the day count, the current status and the 10-day
+        # table. The count is a constant subquery, evaluated once; an empty
+        # table returns no rows at all.
+        rows = self.conn.execute(f"""
+            SELECT (SELECT COUNT(*) FROM daily_weather), * FROM (
+                SELECT {DAILY_WEATHER_ROW_COLUMNS}
+                FROM daily_weather
+                ORDER BY date DESC
+                LIMIT 10
+            ) ORDER BY date
+        """).fetchall()
+        total_days = rows[0][0] if rows else 0
         print(f"  Database: {total_days} days of data\n")
 
         if total_days == 0:
             print("  No data yet. Run with --backfill first.\n")
             return
 
+        recent = [row[1:] for row in rows]
+        latest = recent[-1] if recent else None
+
         # Current GDD status
-        latest = self._get_latest_data()
         if latest:
             print(f"  Latest Data: {latest[0]}")
             print(f"  Temp: {latest[1]:.0f}F low / {latest[2]:.0f}F high / {latest[3]:.0f}F mean")
@@ -1134,7 +1491,6 @@ class GDDWeedAlert:
             print()
 
         # Show recent 10 days
-        recent = self._get_recent_data(10)
         print(f"  {'Date':<12} {'Lo':>5} {'Hi':>5} {'Mean':>5} {'Rain':>6} {'GDD50':>6} {'CumGDD50':>9} {'5dAvg':>6}")
         print(f"  {'-'*12} {'-'*5} {'-'*5} {'-'*5} {'-'*6} {'-'*6} {'-'*9} {'-'*6}")
         for row in recent:
@@ -1174,17 +1530,28 @@ class GDDWeedAlert:
             rain2 = latest[10] or 0
             print(f"    2-Day Rain:     {rain2:.2f} in {'<-- RAIN TRIGGER MET' if rain2 >= 0.25 else ''}")
 
-        # Show sent alerts
-        c.execute("SELECT alert_key, sent_at FROM alerts_sent ORDER BY sent_at DESC")
-        sent = c.fetchall()
+        # Show the most recent sent alerts. rowid breaks same-second ties in
+        # send order; the sent_at index already carries it, so this is an
+        # index walk that stops after alert_limit rows.
+        sent = self.conn.execute(
+            "SELECT alert_key, sent_at FROM alerts_sent ORDER BY sent_at DESC, rowid DESC LIMIT ?",
+            (alert_limit,)).fetchall()
         if sent:
-            print(f"\n  --- Alerts Sent ---")
-            for key, ts in sent:
-                print(f"    {ts}  {key}")
+            # One write for the whole list instead of a print() per alert
+            lines = ["\n  --- Alerts Sent ---"]
+            lines.extend(f"    {datetime.fromtimestamp(ts).isoformat(sep=' ')}  {key}"
+                         for key, ts in sent)
+            sys.stdout.write("\n".join(lines) + "\n")
 
         print()
 
 
+# TRIGGERS key -> GDDWeedAlert check method. Each takes (self, now, recent)
+# and returns the (alert_key, message) pairs it fires; see run_daily_check.
+# Built from the class itself, so a missing check fails at import.
+TRIGGER_CHECKS = {key: getattr(GDDWeedAlert, f"check_{key}") for key in TRIGGERS}
+
+
 # =============================================================================
 # MAIN
 # =============================================================================
@@ -1210,9 +1577,7 @@ def main():
         agent.send_test_alerts()
     elif args.status:
         # Auto-backfill if empty
-        c = agent.conn.cursor()
-        c.execute("SELECT COUNT(*) FROM daily_weather")
-        if c.fetchone()[0] == 0:
+        if agent.conn.execute("SELECT COUNT(*) FROM daily_weather").fetchone()[0] == 0:
             agent.backfill()
         agent.show_status()
     else:
@@ -22,6 +22,7 @@ import os
 import json
 import logging
 from datetime import datetime
+from logging.handlers import RotatingFileHandler
 
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'python_libs'))
 
@@ -219,7 +220,9 @@ class SeasonalScheduleAlert:
                                       datefmt="%Y-%m-%d %H:%M:%S")
 
         log_path = os.path.join(self.script_dir, "seasonal_schedule_alert.log")
-        fh = logging.FileHandler(log_path, encoding="utf-8")
+        # Rotated at 1 MB; delay: the file is only opened once something is logged
+        fh = RotatingFileHandler(log_path, maxBytes=1_000_000, backupCount=3,
+                                 encoding="utf-8", delay=True)
         fh.setLevel(logging.DEBUG)
         fh.setFormatter(formatter)
         logger.addHandler(fh)
@@ -297,7 +300,7 @@ class SeasonalScheduleAlert:
                 timeout=15,
             )
             response.raise_for_status()
-            self.logger.info("Alert sent: %s", message[:60])
+            self.logger.info("Alert sent: %.60s", message)
             return True
         except requests.RequestException as e:
             self.logger.error("Failed to send: %s", e)
@@ -392,13 +395,18 @@ class SeasonalScheduleAlert:
 
     def send_all_tests(self):
         """Send all 4 seasonal alerts for testing."""
-        import time
-        for season in ["Fall", "Winter", "Spring", "Summer"]:
-            message = self.build_message(season)
+        seasons = ["Fall", "Winter", "Spring", "Summer"]
+        sent = 0
+        # Sent one at a time so the texts arrive in season order; each POST
+        # already waits for the webhook's response, so no extra pause
+        for season in seasons:
             print(f"\n--- Sending: {season} Schedule ---")
-            self.send_alert(message)
-            time.sleep(3)  # Space out the texts
-        print("\nAll 4 seasonal alerts sent!")
+            if self.send_alert(self.build_message(season)):
+                sent += 1
+                print("Sent.")
+            else:
+                print("Failed to send.")
+        print(f"\n{sent}/{len(seasons)} seasonal alerts sent!")
 
     def show_status(self):
         """Display all seasonal schedules and alert state."""
@@ -24,17 +24,26 @@ import time
 import json
 import logging
 from datetime import datetime, timedelta
+from logging.handlers import RotatingFileHandler
 
 # Add local python_libs to path (following project convention)
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'python_libs'))
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     REQUESTS_AVAILABLE = True
 except ImportError:
     REQUESTS_AVAILABLE = False
     print("WARNING: 'requests' library not found. Install with: pip install requests")
 
+# orjson is optional; it decodes the forecast payload several times faster
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 
 # =============================================================================
 # CONFIGURATION
@@ -143,7 +152,15 @@ class WeatherAlertAgent:
         self.session.headers.update({
             'User-Agent': 'WeatherAlertAgent/1.0',
             'Accept': 'application/json',
+            'Accept-Encoding': 'gzip, deflate',
         })
+        # Keep-alive pool (one connection per host: Open-Meteo, Zapier) plus
+        # retries on transient Open-Meteo errors. Retry only covers
+        # idempotent methods, so Zapier POSTs are never re-sent.
+        retry = Retry(total=3, backoff_factor=0.3,
+                      status_forcelist=(429, 500, 502, 503, 504))
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=2, pool_maxsize=2, max_retries=retry))
 
         self.state = self._load_state()
 
@@ -163,9 +180,10 @@ class WeatherAlertAgent:
         formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s",
                                       datefmt="%Y-%m-%d %H:%M:%S")
 
-        # File handler
+        # File handler, rotated at 1 MB; delay: opened on first record
         log_path = os.path.join(self.script_dir, OPERATIONAL["log_file"])
-        fh = logging.FileHandler(log_path, encoding="utf-8")
+        fh = RotatingFileHandler(log_path, maxBytes=1_000_000, backupCount=3,
+                                 encoding="utf-8", delay=True)
         fh.setLevel(logging.DEBUG)
         fh.setFormatter(formatter)
         logger.addHandler(fh)
@@ -261,7 +279,7 @@ class WeatherAlertAgent:
                 OPERATIONAL["api_base_url"], params=params, timeout=30
             )
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
 
             # Validate response structure
             daily = data.get("daily", {})
@@ -590,7 +608,7 @@ class WeatherAlertAgent:
                 timeout=15,
             )
             response.raise_for_status()
-            self.logger.info("Alert sent via Zapier: %s", message[:80])
+            self.logger.info("Alert sent via Zapier: %.80s", message)
             return True
 
         except requests.RequestException as e: